@@ -1,7 +1,11 @@
 import re
-from spellchecker import SpellChecker
+from functools import lru_cache
+from detecterreur.spelling import get_spellchecker
 from typing import Tuple, Optional
 
+# Word tokenizer shared by get_error and correct (compiled once)
+_WORD_RE = re.compile(r"\b\w+\b")
+
 class FormAgglutination:
     """
     Detects and corrects agglutination (two words stuck together).
@@ -20,7 +24,11 @@ class FormAgglutination:
     error_category = "FORME"
 
     def __init__(self):
-        self.spell = SpellChecker(language='fr')
+        self.spell = get_spellchecker('fr')
+        # Memoized dictionary membership (word frequencies are Zipfian, most lookups repeat)
+        self._known = lru_cache(maxsize=65536)(lambda w: w in self.spell)
+        # Memoized split decision per token (get_error and correct ask for the same words)
+        self._split_for = lru_cache(maxsize=16384)(self._compute_split)
         
         # Comprehensive list of "Glue Words" (High frequency grammatical connectors)
         # These are the usual suspects in agglutination errors.
@@ -36,46 +44,65 @@ class FormAgglutination:
             "a", "à", "et", "ou", "où", "si", "ni", "car", "par", "pour", "sans", 
             "dans", "sur", "sous", "vers", "avec", "chez", "mais", "donc", "or"
         }
+        # Glue words bucketed by length: only split points where a glue word
+        # ends the left part or starts the right part can pass the glue check.
+        self.glue_by_len = {}
+        for glue in self.glue_words:
+            self.glue_by_len.setdefault(len(glue), set()).add(glue)
 
     def get_error(self, sentence: str) -> Tuple[str, str, bool]:
-        words = re.findall(r"\b\w+\b", sentence)
-        for word in words:
-            if self._check_word(word):
+        # Lazy scan: stops tokenizing at the first agglutinated word
+        for match in _WORD_RE.finditer(sentence):
+            if self._check_word(match.group()):
                 return self.error_category, self.error_name, True
         return self.error_category, self.error_name, False
 
     def correct(self, sentence: str) -> str:
-        corrected = sentence
         # Use finditer to preserve whitespace/punctuation
-        matches = list(re.finditer(r"\b\w+\b", sentence))
-        
-        # Reverse iteration to modify indices safely
-        for match in reversed(matches):
-            word = match.group()
-            
+        # The sentence is rebuilt in a single pass instead of re-slicing it per edit
+        parts = []
+        cursor = 0
+        for match in _WORD_RE.finditer(sentence):
             # Check for split
-            split = self._check_word(word)
+            split = self._check_word(match.group())
             if split:
                 start, end = match.span()
-                corrected = corrected[:start] + split + corrected[end:]
-        
-        return corrected
+                parts.append(sentence[cursor:start])
+                parts.append(split)
+                cursor = end
+
+        parts.append(sentence[cursor:])
+        return "".join(parts)
 
     def _check_word(self, word: str) -> Optional[str]:
         """
         Returns 'word1 word2' if safe split found, else None.
         """
+        return self._split_for(word)
+
+    def _compute_split(self, word: str) -> Optional[str]:
         # 1. Quick Valid Check
         # If the word is known, assume it's correct.
         # This protects "mangent" (known) from becoming "man gent" (man=slang, gent=noun).
-        if word.lower() in self.spell:
+        if self._known(word.lower()):
             return None
         
         # 2. Try Splitting
         length = len(word)
         if length < 3: return None
 
-        for i in range(1, length):
+        # 3. GLUE CHECK (The Safety Filter)
+        # One of the parts MUST be a glue word.
+        # "dansle" -> "dans" (Glue) + "le" (Glue) -> OK.
+        # "mangent" -> "man" (Not Glue) + "gent" (Not Glue) -> REJECT.
+        # Only the split points that satisfy it are visited, in ascending order.
+        split_points = set()
+        for n, glues in self.glue_by_len.items():
+            if n >= length: continue
+            if word[:n].lower() in glues: split_points.add(n)
+            if word[length - n:].lower() in glues: split_points.add(length - n)
+
+        for i in sorted(split_points):
             left = word[:i]
             right = word[i:]
             
@@ -83,14 +110,6 @@ class FormAgglutination:
             if len(left) == 1 and left.lower() not in ["y", "a", "à", "l", "d"]: continue
             if len(right) == 1 and right.lower() not in ["y", "a", "à"]: continue
 
-            # 3. GLUE CHECK (The Safety Filter)
-            # One of the parts MUST be a glue word.
-            # "dansle" -> "dans" (Glue) + "le" (Glue) -> OK.
-            # "mangent" -> "man" (Not Glue) + "gent" (Not Glue) -> REJECT.
-            is_glue = (left.lower() in self.glue_words or right.lower() in self.glue_words)
-            if not is_glue:
-                continue
-
             # 4. DICTIONARY CHECK
             # Both parts must be valid words.
             if self._is_valid(left) and self._is_valid(right):
@@ -100,4 +119,4 @@ class FormAgglutination:
 
     def _is_valid(self, w: str) -> bool:
         # Helper to check validity
-        return w.lower() in self.glue_words or w.lower() in self.spell
\ No newline at end of file
+        return w.lower() in self.glue_words or self._known(w.lower())
\ No newline at end of file
@@ -1,6 +1,13 @@
 import re
 from typing import Tuple, List, Optional
-from pygrammalecte import grammalecte_text, GrammalecteGrammarMessage
+from pygrammalecte import GrammalecteGrammarMessage
+from detecterreur.grammar_check import analyze
+
+# Regex for sentence starts:
+# Group 1: Start of line OR (.!? + whitespace)
+# Group 2: The lowercase letter to fix
+_SENTENCE_START_RE = re.compile(r'(^|[.!?]\s+)([a-zàâéèêëîïôùûüç])')
+
 
 class FormCase:
     """
@@ -20,10 +27,7 @@ class FormCase:
     error_category = "FORME"
 
     def __init__(self):
-        # Regex for sentence starts:
-        # Group 1: Start of line OR (.!? + whitespace)
-        # Group 2: The lowercase letter to fix
-        self.sentence_start_pattern = re.compile(r'(^|[.!?]\s+)([a-zàâéèêëîïôùûüç])')
+        self.sentence_start_pattern = _SENTENCE_START_RE
 
     # -------------------------------
     # Public API
@@ -39,7 +43,7 @@ class FormCase:
             return self.error_category, self.error_name, True
 
         # 2. Grammalecte Check (For proper nouns mid-sentence)
-        for message in grammalecte_text(sentence):
+        for message in analyze(sentence):
             if isinstance(message, GrammalecteGrammarMessage):
                 if self._is_capitalization_error(message):
                     original = sentence[message.start:message.end]
@@ -68,7 +72,7 @@ class FormCase:
         suggestions_to_apply = []
 
         # Run detection on the ALREADY regex-corrected string to avoid conflicts
-        for message in grammalecte_text(corrected):
+        for message in analyze(corrected):
             if isinstance(message, GrammalecteGrammarMessage):
                 if self._is_capitalization_error(message) and message.suggestions:
                     original = corrected[message.start:message.end]
@@ -78,13 +82,20 @@ class FormCase:
                     if original.lower() == suggestion.lower():
                         suggestions_to_apply.append((message.start, message.end, suggestion))
 
-        # Apply Right-to-Left to avoid offset issues
-        suggestions_to_apply.sort(key=lambda x: x[0], reverse=True)
+        # Rebuild in one left-to-right pass (overlapping spans are skipped)
+        suggestions_to_apply.sort(key=lambda x: x[0])
 
+        parts = []
+        cursor = 0
         for start, end, replacement in suggestions_to_apply:
-            corrected = corrected[:start] + replacement + corrected[end:]
-
-        return corrected
+            if start < cursor:
+                continue
+            parts.append(corrected[cursor:start])
+            parts.append(replacement)
+            cursor = end
+
+        parts.append(corrected[cursor:])
+        return "".join(parts)
 
     # -------------------------------
     # Internal Logic
@@ -1,19 +1,83 @@
 import re
-from spellchecker import SpellChecker
+import unicodedata
+from functools import cached_property, lru_cache
+from detecterreur.spelling import get_spellchecker
 from typing import Tuple, Optional
 from detecterreur.validator import Validator # <--- IMPORT
 
+# Word tokenizer shared by get_error and correct (compiled once)
+_WORD_RE = re.compile(r"\b\w+\b")
+
+
+@lru_cache(maxsize=512)
+def _tokenize(sentence: str) -> Tuple[Tuple[int, int, str], ...]:
+    """
+    (start, end, word) spans of a sentence, cached so that get_error and
+    correct on the same sentence tokenize it only once.
+    """
+    return tuple((m.start(), m.end(), m.group()) for m in _WORD_RE.finditer(sentence))
+
+
+def _build_accent_table() -> dict:
+    """
+    Translation table equivalent to NFKD + dropping combining marks, for the
+    Latin ranges French text actually uses (Latin-1, Extended-A/B and
+    Extended Additional) plus the standalone combining diacritics.
+    """
+    table = {}
+    codepoints = [*range(0x00C0, 0x0250), *range(0x1E00, 0x1F00), *range(0x0300, 0x0370)]
+    for cp in codepoints:
+        char = chr(cp)
+        stripped = "".join(c for c in unicodedata.normalize('NFKD', char) if not unicodedata.combining(c))
+        if stripped != char:
+            table[cp] = stripped or None
+    return table
+
+
+ACCENT_TABLE = _build_accent_table()
+
+
+@lru_cache(maxsize=None)
+def _build_folded_index(language: str, distance: int) -> dict:
+    """
+    Buckets dictionary words by their accent-stripped form.
+    Diacritic siblings ("eleve", "élève", "élevé") share a bucket, so the
+    candidates for a word are a single dict lookup instead of an edit expansion.
+    Built once per shared SpellChecker, so every FormDiacritic reuses it.
+    Each bucket is sorted by decreasing frequency (ties keep dictionary order),
+    so the best sibling is the first one that passes the distance filter.
+    """
+    frequencies = get_spellchecker(language, distance).word_frequency.dictionary
+    buckets = {}
+    for w in frequencies:
+        buckets.setdefault(w.translate(ACCENT_TABLE), []).append(w)
+    # Frozen as tuples: exact-size and immutable, since the index is shared
+    return {
+        folded: tuple(sorted(bucket, key=frequencies.__getitem__, reverse=True))
+        for folded, bucket in buckets.items()
+    }
+
+
 class FormDiacritic:
     error_name = "FDIA"
     error_category = "FORME"
 
     def __init__(self, distance: int = 1):
-        self.spell = SpellChecker(language='fr', distance=distance)
+        self.spell = get_spellchecker('fr', distance)
+        self.distance = distance
         self.validator = Validator() # <--- INSTANTIATE
+        # Raw word -> count mapping: one dict probe instead of WordFrequency's wrappers
+        self.frequencies = self.spell.word_frequency.dictionary
+        # Corrections memoized per lowercased word (the spellchecker is case-insensitive)
+        self._correction_for = lru_cache(maxsize=50000)(self._compute_correction)
+
+    @cached_property
+    def folded_index(self) -> dict:
+        # Built lazily on first lookup, then shared across instances
+        return _build_folded_index('fr', self.distance)
 
     def get_error(self, sentence: str) -> Tuple[str, str, bool]:
-        words = re.findall(r"\b\w+\b", sentence)
-        for word in words:
+        for _, _, word in _tokenize(sentence):
             # SAFETY: "cuisine" is valid -> Skip
             if self.validator.is_valid(word):
                 continue
@@ -23,40 +87,40 @@ class FormDiacritic:
         return self.error_category, self.error_name, False
 
     def correct(self, sentence: str) -> str:
-        corrected = sentence
-        matches = list(re.finditer(r"\b\w+\b", sentence))
-        
-        for match in reversed(matches):
-            word = match.group()
-            
+        # Single-pass rebuild instead of re-slicing the sentence per edit
+        parts = []
+        cursor = 0
+        for start, end, word in _tokenize(sentence):
             # SAFETY: "cuisine" is valid -> Skip
             if self.validator.is_valid(word):
                 continue
 
             fix = self._get_correction(word)
             if fix:
-                start, end = match.span()
-                fix = self._match_case(word, fix)
-                corrected = corrected[:start] + fix + corrected[end:]
-        return corrected
+                parts.append(sentence[cursor:start])
+                parts.append(self._match_case(word, fix))
+                cursor = end
+
+        parts.append(sentence[cursor:])
+        return "".join(parts)
 
     def _get_correction(self, word: str) -> Optional[str]:
-        candidates = self.spell.candidates(word)
-        if not candidates: return None
-
-        import unicodedata
-        def remove_accents(input_str):
-            nfkd_form = unicodedata.normalize('NFKD', input_str)
-            return "".join([c for c in nfkd_form if not unicodedata.combining(c)])
-
-        word_stripped = remove_accents(word.lower())
-        valid_candidates = []
-        for c in candidates:
-            if c != word.lower() and remove_accents(c) == word_stripped:
-                valid_candidates.append(c)
-
-        if not valid_candidates: return None
-        return max(valid_candidates, key=lambda w: self.spell.word_frequency[w])
+        return self._correction_for(word.lower())
+
+    def _compute_correction(self, word_lower: str) -> Optional[str]:
+        # Known words are never corrected
+        if word_lower in self.frequencies: return None
+
+        siblings = self.folded_index.get(word_lower.translate(ACCENT_TABLE))
+        if not siblings: return None
+
+        # Buckets are pre-sorted by frequency: the first sibling within the edit
+        # budget (accent swaps are substitutions) is the most frequent one
+        for c in siblings:
+            if len(c) != len(word_lower): continue
+            if sum(a != b for a, b in zip(c, word_lower)) <= self.distance:
+                return c
+        return None
 
     def _match_case(self, original: str, corrected: str) -> str:
         if original.isupper(): return corrected.upper()
@@ -1,5 +1,6 @@
 from typing import Tuple, List
-from pygrammalecte import grammalecte_text, GrammalecteGrammarMessage
+from pygrammalecte import GrammalecteGrammarMessage
+from detecterreur.grammar_check import analyze, has_word_pair
 
 class GrammarAgreement:
     """
@@ -22,7 +23,10 @@ class GrammarAgreement:
         Returns:
             Tuple[str, str, bool]: (error_category, error_name, has_error)
         """
-        for message in grammalecte_text(sentence):
+        if not has_word_pair(sentence):
+            return self.error_category, self.error_name, False
+
+        for message in analyze(sentence):
             if isinstance(message, GrammalecteGrammarMessage):
                 if message.type in self.AGREEMENT_TYPES:
                     return self.error_category, self.error_name, True
@@ -34,23 +38,32 @@ class GrammarAgreement:
         Returns:
             str: The corrected sentence.
         """
-        corrected = sentence
+        if not has_word_pair(sentence):
+            return sentence
+
         corrections = []
 
         # Collect all corrections
-        for message in grammalecte_text(sentence):
+        for message in analyze(sentence):
             if isinstance(message, GrammalecteGrammarMessage):
                 if message.type in self.AGREEMENT_TYPES and message.suggestions:
                     # Store (start, end, suggestion_list)
                     corrections.append((message.start, message.end, message.suggestions))
 
-        # Apply corrections right-to-left to avoid offset issues
-        corrections.sort(key=lambda x: x[0], reverse=True)
+        # Rebuild the sentence in one left-to-right pass (overlapping spans are skipped)
+        corrections.sort(key=lambda x: x[0])
 
+        parts = []
+        cursor = 0
         for start, end, suggestions in corrections:
+            if start < cursor:
+                continue
             # Heuristic: Pick the longest suggestion to avoid truncation issues
             # (e.g., "Le fil" vs "La fille")
             best_sugg = max(suggestions, key=len) if suggestions else ""
-            corrected = corrected[:start] + best_sugg + corrected[end:]
+            parts.append(sentence[cursor:start])
+            parts.append(best_sugg)
+            cursor = end
 
-        return corrected
+        parts.append(sentence[cursor:])
+        return "".join(parts)
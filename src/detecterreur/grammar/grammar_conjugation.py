@@ -1,11 +1,12 @@
 from typing import Tuple, List
-from pygrammalecte import grammalecte_text, GrammalecteGrammarMessage
+from pygrammalecte import GrammalecteGrammarMessage
+from detecterreur.grammar_check import analyze, has_word_pair
 
 class GrammarConjugation:
     """
     Detects and corrects French conjugation errors using Grammalecte.
     Only targets errors of type "conj" (conjugation).
-    Applies corrections right-to-left to avoid index shifting issues.
+    Applies all corrections in a single left-to-right pass.
 
     Category: GRAMMAIRE
     Error: GCON
@@ -19,7 +20,10 @@ class GrammarConjugation:
         Returns:
             Tuple[str, str, bool]: (error_category, error_name, has_error)
         """
-        for message in grammalecte_text(sentence):
+        if not has_word_pair(sentence):
+            return self.error_category, self.error_name, False
+
+        for message in analyze(sentence):
             if isinstance(message, GrammalecteGrammarMessage):
                 if message.type == "conj":
                     return self.error_category, self.error_name, True
@@ -31,19 +35,28 @@ class GrammarConjugation:
         Returns:
             str: The corrected sentence.
         """
-        corrected = sentence
+        if not has_word_pair(sentence):
+            return sentence
+
         corrections = []
 
         # Collect all conjugation errors and their suggested corrections
-        for message in grammalecte_text(sentence):
+        for message in analyze(sentence):
             if isinstance(message, GrammalecteGrammarMessage) and message.type == "conj":
                 if message.suggestions:
                     corrections.append((message.start, message.end, message.suggestions[0]))
 
-        # Apply corrections right-to-left to avoid index shifting issues
-        corrections.sort(key=lambda x: x[0], reverse=True)
+        # Rebuild the sentence in one left-to-right pass (overlapping spans are skipped)
+        corrections.sort(key=lambda x: x[0])
 
+        parts = []
+        cursor = 0
         for start, end, suggestion in corrections:
-            corrected = corrected[:start] + suggestion + corrected[end:]
-
-        return corrected
+            if start < cursor:
+                continue
+            parts.append(sentence[cursor:start])
+            parts.append(suggestion)
+            cursor = end
+
+        parts.append(sentence[cursor:])
+        return "".join(parts)
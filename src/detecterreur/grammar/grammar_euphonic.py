@@ -17,26 +17,33 @@ class GrammarEuphonic:
     error_name = "GEUF"
     error_category = "GRAMMAIRE"
 
-    def __init__(self):
-        # Subject pronouns involved in inversion
-        self.pronouns = r"(?:il|elle|on|ils|elles|iel)"
+    # Patterns are compiled once, when the class is defined, and shared by all instances
 
-        # Vowels (including accented ones common in French verbs)
-        self.vowels = "aeiouyàâéèêëîïôùûü"
+    # Subject pronouns involved in inversion
+    pronouns = r"(?:il|elle|on|ils|elles|iel)"
 
-        # Pattern 1: Vowel collision → Needs "-t-"
-        # Example: "A il" → "A-t-il"
-        self.pat_vowel = re.compile(
-            rf"\b(\w+[{re.escape(self.vowels)}])\s+({self.pronouns})\b",
-            re.IGNORECASE
-        )
+    # Vowels (including accented ones common in French verbs)
+    vowels = "aeiouyàâéèêëîïôùûü"
 
-        # Pattern 2: Missing hyphen → Needs "-"
-        # Example: "Vient il" → "Vient-il"
-        self.pat_consonant = re.compile(
-            r"\b(\w+[td])\s+(%s)\b" % self.pronouns,
-            re.IGNORECASE
-        )
+    # Pattern 1: Vowel collision → Needs "-t-"
+    # Example: "A il" → "A-t-il"
+    pat_vowel = re.compile(
+        rf"\b(\w+[{re.escape(vowels)}])\s+({pronouns})\b",
+        re.IGNORECASE
+    )
+
+    # Pattern 2: Missing hyphen → Needs "-"
+    # Example: "Vient il" → "Vient-il"
+    pat_consonant = re.compile(
+        r"\b(\w+[td])\s+(%s)\b" % pronouns,
+        re.IGNORECASE
+    )
+
+    # Detection only: both rules merged into one character class, one scan per sentence
+    pat_any = re.compile(
+        rf"\b\w+[{re.escape(vowels)}td]\s+{pronouns}\b",
+        re.IGNORECASE
+    )
 
     def get_error(self, sentence: str) -> Tuple[str, str, bool]:
         """
@@ -44,9 +51,7 @@ class GrammarEuphonic:
         Returns:
             Tuple[str, str, bool]: (error_category, error_name, has_error)
         """
-        if self.pat_vowel.search(sentence):
-            return self.error_category, self.error_name, True
-        if self.pat_consonant.search(sentence):
+        if self.pat_any.search(sentence):
             return self.error_category, self.error_name, True
         return self.error_category, self.error_name, False
 
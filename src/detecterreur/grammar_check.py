@@ -0,0 +1,35 @@
+import re
+from functools import lru_cache
+from typing import Tuple
+from pygrammalecte import grammalecte_text, GrammalecteMessage
+
+# Two word characters separated by a non-word character
+_WORD_PAIR_RE = re.compile(r"\w\W+\w")
+
+
+@lru_cache(maxsize=1024)
+def analyze(sentence: str) -> Tuple[GrammalecteMessage, ...]:
+    """
+    Runs Grammalecte once per distinct sentence and shares the messages across
+    detectors (get_error and correct of FormCase, GrammarAgreement and
+    GrammarConjugation all hit the same entry).
+    Callers must treat the returned messages as read-only.
+    Args:
+        sentence (str): The sentence to check.
+    Returns:
+        Tuple[GrammalecteMessage, ...]: Grammar and spelling messages.
+    """
+    return tuple(grammalecte_text(sentence))
+
+
+def has_word_pair(sentence: str) -> bool:
+    """
+    Cheap pre-filter for multi-word grammar rules.
+    Agreement (gn, ppas) and conjugation (conj) errors always involve at least
+    two words, so single-word input can skip Grammalecte entirely.
+    Args:
+        sentence (str): The sentence to check.
+    Returns:
+        bool: True if the sentence contains at least two words.
+    """
+    return _WORD_PAIR_RE.search(sentence) is not None
@@ -1,8 +1,12 @@
 import re
-from spellchecker import SpellChecker
+from functools import lru_cache
+from detecterreur.spelling import get_spellchecker, deletions
 from typing import Tuple, Optional
 from detecterreur.validator import Validator 
 
+# Tokeniseur de mots partagé par get_error et correct (compilé une seule fois)
+_WORD_RE = re.compile(r"\b\w+\b")
+
 class LetterInsertion:
     """
     Détecte les erreurs d'insertion (lettre en trop).
@@ -13,74 +17,84 @@ class LetterInsertion:
 
     def __init__(self, language="fr", distance=1):
         # Initialisation du spellchecker avec la distance spécifiée
-        self.spell = SpellChecker(language=language, distance=distance)
+        self.spell = get_spellchecker(language, distance)
         self.distance = distance
         self.validator = Validator()
+        # Corrections mémorisées par mot en minuscule (spell et distance sont fixes)
+        self._correction_for = lru_cache(maxsize=50000)(self._compute_correction)
+        # Analyse mémorisée par phrase : get_error puis correct ne parcourent la phrase qu'une fois
+        self._analysis_for = lru_cache(maxsize=256)(self._compute_analysis)
 
     def get_error(self, sentence: str) -> Tuple[str, str, bool]:
-        # \b\w+\b est idéal : il split par espaces et ponctuation
-        words = re.findall(r"\b\w+\b", sentence)
-        
-        for word in words:
-            # 1. On saute si le mot est valide (spaCy ou dictionnaire)
-            if self.validator.is_valid(word):
-                continue
-
-            # 2. On vérifie si c'est une erreur d'insertion (lettre en trop)
-            # On ne vérifie que si le mot est inconnu du dictionnaire pur
-            if word.lower() not in self.spell.word_frequency:
-                if self._get_correction(word):
-                    return self.error_category, self.error_name, True
-                    
-        return self.error_category, self.error_name, False
+        has_error, _ = self.analyze(sentence)
+        return self.error_category, self.error_name, has_error
 
     def correct(self, sentence: str) -> str:
-        corrected = sentence
-        # On itère à l'envers pour ne pas décaler les indices (span) lors des remplacements
-        matches = list(re.finditer(r"\b\w+\b", sentence))
-        
-        for match in reversed(matches):
-            word = match.group()
-            
-            # Sécurité : ne pas corriger un mot valide
-            if self.validator.is_valid(word):
-                continue
-            
-            # On cherche une correction uniquement pour les mots inconnus
-            if word.lower() not in self.spell.word_frequency:
-                fix = self._get_correction(word)
-                if fix:
-                    start, end = match.span()
-                    # Gestion intelligente de la casse
-                    if word[0].isupper(): 
-                        fix = fix.capitalize()
-                    corrected = corrected[:start] + fix + corrected[end:]
-                    
+        _, corrected = self.analyze(sentence)
         return corrected
 
+    def analyze(self, sentence: str) -> Tuple[bool, str]:
+        """
+        Détecte et corrige en un seul parcours de la phrase.
+        get_error et correct lisent le même résultat (mis en cache par phrase).
+        Returns:
+            Tuple[bool, str]: (has_error, phrase corrigée)
+        """
+        return self._analysis_for(sentence)
+
+    def _compute_analysis(self, sentence: str) -> Tuple[bool, str]:
+        # Correction calculée une seule fois par mot distinct (en minuscule)
+        fix_map = {}
+        has_error = False
+        parts = []
+        cursor = 0
+
+        # \b\w+\b est idéal : il split par espaces et ponctuation
+        for match in _WORD_RE.finditer(sentence):
+            word = match.group()
+            word_lower = word.lower()
+
+            if word_lower not in fix_map:
+                fix_map[word_lower] = None
+                # Sécurité : ne pas corriger un mot valide (spaCy ou dictionnaire)
+                # On cherche une correction uniquement pour les mots inconnus
+                if not self.validator.is_valid(word) and word_lower not in self.spell.word_frequency:
+                    fix_map[word_lower] = self._get_correction(word)
+
+            fix = fix_map[word_lower]
+            if fix:
+                has_error = True
+                # Gestion intelligente de la casse
+                if word[0].isupper(): 
+                    fix = fix.capitalize()
+                parts.append(sentence[cursor:match.start()])
+                parts.append(fix)
+                cursor = match.end()
+
+        parts.append(sentence[cursor:])
+        return has_error, "".join(parts)
+
     def _get_correction(self, word: str) -> Optional[str]:
-        word_lower = word.lower()
-        candidates = self.spell.candidates(word_lower)
-        if not candidates: return None
-        
-        valid_candidates = []
-        for c in candidates:
-            # Règle OINS : Le candidat doit être PLUS COURT (on a inséré une lettre en trop)
-            if len(c) >= len(word_lower): 
-                continue
-            
-            # Vérification de la distance et de la sous-séquence
-            if (len(word_lower) - len(c)) <= self.distance:
-                if self._is_subsequence(c, word_lower):
-                    valid_candidates.append(c)
+        return self._correction_for(word.lower())
+
+    def _compute_correction(self, word_lower: str) -> Optional[str]:
+        frequencies = self.spell.word_frequency.dictionary
+        # Un mot connu n'est jamais corrigé
+        if word_lower in frequencies: return None
 
-        if not valid_candidates: 
-            return None
-            
-        # On retourne le candidat le plus fréquent dans la langue française
-        return max(valid_candidates, key=lambda w: self.spell.word_frequency[w])
+        # Règle OINS : le candidat s'obtient en SUPPRIMANT des lettres du mot.
+        # On énumère directement les suppressions (1 lettre, puis 2, ... jusqu'à distance)
+        # au lieu de générer tout le voisinage d'édition via spell.candidates().
+        level = {word_lower}
+        for tier in range(self.distance):
+            # Comme spell.candidates() : on ne dépasse une édition que si le mot
+            # n'a AUCUN voisin connu à distance 1 (substitution, inversion, ...)
+            if tier == 1 and self.spell.known(self.spell.edit_distance_1(word_lower)):
+                return None
+            level = deletions(level)
+            valid_candidates = [c for c in level if c in frequencies]
+            if valid_candidates:
+                # On retourne le candidat le plus fréquent dans la langue française
+                return max(valid_candidates, key=frequencies.__getitem__)
 
-    def _is_subsequence(self, sub: str, main: str) -> bool:
-        """Vérifie si 'sub' peut être obtenu en supprimant des lettres dans 'main'"""
-        it = iter(main)
-        return all(char in it for char in sub)
\ No newline at end of file
+        return None
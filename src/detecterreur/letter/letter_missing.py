@@ -1,9 +1,13 @@
 import re
 import string
+from functools import lru_cache
 from typing import Tuple, Optional
-from spellchecker import SpellChecker
+from detecterreur.spelling import get_spellchecker, insertions
 from detecterreur.validator import Validator 
 
+# Tokeniseur de mots partagé par get_error et correct (compilé une seule fois)
+_WORD_RE = re.compile(r"\b\w+\b")
+
 class LetterMissing:
     """
     Détecte et corrige les erreurs d'omission (lettre manquante).
@@ -16,56 +20,37 @@ class LetterMissing:
     error_category = "ORTHOGRAPHE"
 
     def __init__(self, language: str = "fr", distance: int = 1):
-        self.spell = SpellChecker(language=language, distance=distance)
+        self.spell = get_spellchecker(language, distance)
         self.distance = distance
         self.validator = Validator()
+        # Corrections mémorisées par mot en minuscule (spell et distance sont fixes)
+        self._missing_correction_for = lru_cache(maxsize=50000)(self._compute_missing_correction)
+        # Analyse mémorisée par phrase : get_error puis correct ne parcourent la phrase qu'une fois
+        self._analysis_for = lru_cache(maxsize=256)(self._compute_analysis)
 
     def get_error(self, sentence: str) -> Tuple[str, str, bool]:
         """
         Détecte si la phrase contient un mot avec une lettre manquante.
         """
-        # On extrait uniquement les mots (lettres/chiffres), ignorant la ponctuation
-        words = re.findall(r"\b\w+\b", sentence)
-        
-        for word in words:
-            # 1. Sécurité : Si spaCy ou pyspellchecker connaissent le mot, on l'ignore
-            if self.validator.is_valid(word):
-                continue
-
-            # 2. On vérifie si c'est une omission
-            if self.is_error(word):
-                return self.error_category, self.error_name, True
-
-        return self.error_category, self.error_name, False
+        has_error, _ = self.analyze(sentence)
+        return self.error_category, self.error_name, has_error
 
     def correct(self, sentence: str) -> str:
         """
         Corrige les omissions en préservant la structure originale.
         """
-        corrected = sentence
-        matches = list(re.finditer(r"\b\w+\b", sentence))
-        
-        # Inversion pour préserver les indices de remplacement
-        for match in reversed(matches):
-            word = match.group()
-            lower_word = word.lower()
-
-            # Sécurité durant la correction
-            if self.validator.is_valid(word):
-                continue
-            
-            # Si le mot (en minuscule) est dans le dictionnaire, on ne touche à rien
-            if lower_word in self.spell.word_frequency:
-                continue
-
-            fix = self._get_missing_correction(lower_word)
-            if fix:
-                final_fix = self._match_case(word, fix)
-                start, end = match.span()
-                corrected = corrected[:start] + final_fix + corrected[end:]
-
+        _, corrected = self.analyze(sentence)
         return corrected
 
+    def analyze(self, sentence: str) -> Tuple[bool, str]:
+        """
+        Détecte et corrige en un seul parcours de la phrase.
+        get_error et correct lisent le même résultat (mis en cache par phrase).
+        Returns:
+            Tuple[bool, str]: (has_error, phrase corrigée)
+        """
+        return self._analysis_for(sentence)
+
     def is_error(self, word: str) -> bool:
         """
         Vérifie si le mot présente une erreur d'omission.
@@ -76,35 +61,62 @@ class LetterMissing:
     # Helpers Internes
     # ---------------------------------------------------------
     def _get_missing_correction(self, word: str) -> Optional[str]:
+        return self._missing_correction_for(word)
+
+    def _compute_missing_correction(self, word: str) -> Optional[str]:
         if not word:
             return None
 
-        candidates = self.spell.candidates(word)
-        if not candidates:
+        frequencies = self.spell.word_frequency.dictionary
+        # Un mot connu n'est jamais corrigé
+        if word in frequencies:
             return None
 
-        valid_corrections = []
-        for candidate in candidates:
-            # Règle OMIS : Le candidat est PLUS LONG (on a oublié une lettre)
-            if len(candidate) > len(word):
-                diff = len(candidate) - len(word)
-                if diff <= self.distance:
-                    # Sous-séquence : "commne" est contenu dans "commune"
-                    if self._is_subsequence(word, candidate):
-                        valid_corrections.append(candidate)
-
-        if not valid_corrections:
-            return None
+        # Règle OMIS : le candidat s'obtient en INSÉRANT des lettres dans le mot.
+        # On énumère directement les insertions (1 lettre, puis 2, ... jusqu'à distance)
+        # avec l'alphabet du dictionnaire, au lieu de passer par spell.candidates().
+        letters = self.spell.word_frequency.letters
+        level = {word}
+        for tier in range(self.distance):
+            # Comme spell.candidates() : on ne dépasse une édition que si le mot
+            # n'a AUCUN voisin connu à distance 1 (substitution, inversion, ...)
+            if tier == 1 and self.spell.known(self.spell.edit_distance_1(word)):
+                return None
+            level = insertions(level, letters)
+            valid_corrections = [cand for cand in level if cand in frequencies]
+            if valid_corrections:
+                # On choisit le mot le plus fréquent dans la langue française
+                return max(valid_corrections, key=frequencies.__getitem__)
+
+        return None
+
+    def _compute_analysis(self, sentence: str) -> Tuple[bool, str]:
+        # Correction calculée une seule fois par mot distinct (en minuscule)
+        fix_map = {}
+        has_error = False
+        parts = []
+        cursor = 0
 
-        # On choisit le mot le plus fréquent dans la langue française
-        return max(valid_corrections, key=lambda w: self.spell.word_frequency[w])
-    
-    def _is_subsequence(self, sub: str, main: str) -> bool:
-        """
-        Vérifie si 'sub' peut être formé en supprimant des lettres dans 'main'.
-        """
-        it = iter(main)
-        return all(char in it for char in sub)
+        # On extrait uniquement les mots (lettres/chiffres), ignorant la ponctuation
+        for match in _WORD_RE.finditer(sentence):
+            word = match.group()
+            lower_word = word.lower()
+
+            if lower_word not in fix_map:
+                fix_map[lower_word] = None
+                # Sécurité : si spaCy ou pyspellchecker connaissent le mot, on l'ignore
+                if not self.validator.is_valid(word) and lower_word not in self.spell.word_frequency:
+                    fix_map[lower_word] = self._get_missing_correction(lower_word)
+
+            fix = fix_map[lower_word]
+            if fix:
+                has_error = True
+                parts.append(sentence[cursor:match.start()])
+                parts.append(self._match_case(word, fix))
+                cursor = match.end()
+
+        parts.append(sentence[cursor:])
+        return has_error, "".join(parts)
 
     def _match_case(self, original: str, corrected: str) -> str:
         """
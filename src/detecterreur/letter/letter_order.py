@@ -1,9 +1,12 @@
 import re
 import string
 from typing import Tuple, Optional
-from spellchecker import SpellChecker
+from detecterreur.spelling import get_spellchecker
 from detecterreur.validator import Validator 
 
+# Tokeniseur de mots partagé par get_error et correct (compilé une seule fois)
+_WORD_RE = re.compile(r"\b\w+\b")
+
 class LetterOrder:
     """
     Détecte et corrige les erreurs d'ordre des lettres (transpositions adjacentes).
@@ -17,16 +20,16 @@ class LetterOrder:
 
     def __init__(self, language: str = "fr"):
         # On garde une distance de 1 car une inversion correspond à un Edit Distance de 1 (Damerau-Levenshtein)
-        self.spell = SpellChecker(language=language, distance=1)
+        self.spell = get_spellchecker(language, 1)
         self.validator = Validator()
 
     def get_error(self, sentence: str) -> Tuple[str, str, bool]:
         """
         Détecte si la phrase contient une inversion de lettres adjacentes.
         """
-        words = re.findall(r"\b\w+\b", sentence)
-        
-        for word in words:
+        # Parcours paresseux : la tokenisation s'arrête à la première erreur
+        for match in _WORD_RE.finditer(sentence):
+            word = match.group()
             # 1. Sécurité : On ignore le mot s'il est connu par spaCy ou pyspellchecker
             if self.validator.is_valid(word):
                 continue
@@ -42,7 +45,7 @@ class LetterOrder:
         Corrige les inversions en préservant la ponctuation et les espaces.
         """
         corrected = sentence
-        matches = list(re.finditer(r"\b\w+\b", sentence))
+        matches = list(_WORD_RE.finditer(sentence))
         
         # Parcours inversé pour garder les indices de span valides
         for match in reversed(matches):
@@ -1,8 +1,11 @@
 import re
 from typing import Tuple, Optional
-from spellchecker import SpellChecker
+from detecterreur.spelling import get_spellchecker
 from detecterreur.validator import Validator 
 
+# Tokeniseur de mots partagé par get_error et correct (compilé une seule fois)
+_WORD_RE = re.compile(r"\b\w+\b")
+
 class LetterSubstitution:
     """
     Détecte et corrige les erreurs de substitution (une lettre remplacée par une autre).
@@ -15,7 +18,7 @@ class LetterSubstitution:
     error_category = "ORTHOGRAPHE"
 
     def __init__(self, language: str = "fr", distance: int = 1):
-        self.spell = SpellChecker(language=language, distance=distance)
+        self.spell = get_spellchecker(language, distance)
         self.distance = distance
         self.validator = Validator()
 
@@ -23,8 +26,9 @@ class LetterSubstitution:
         """
         Détecte si la phrase contient une erreur de substitution.
         """
-        words = re.findall(r"\b\w+\b", sentence)
-        for word in words:
+        # Parcours paresseux : la tokenisation s'arrête à la première erreur
+        for match in _WORD_RE.finditer(sentence):
+            word = match.group()
             # 1. Sécurité : Si le mot est connu de spaCy ou du dictionnaire, on l'ignore.
             if self.validator.is_valid(word):
                 continue
@@ -41,7 +45,7 @@ class LetterSubstitution:
         Remplace les mots erronés par leur version corrigée.
         """
         corrected = sentence
-        matches = list(re.finditer(r"\b\w+\b", sentence))
+        matches = list(_WORD_RE.finditer(sentence))
 
         # Parcours inversé pour maintenir l'intégrité des indices (spans)
         for match in reversed(matches):
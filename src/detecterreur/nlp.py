@@ -0,0 +1,33 @@
+import spacy
+from functools import lru_cache
+from spacy.language import Language
+from spacy.tokens import Doc
+
+
+@lru_cache(maxsize=None)
+def load_model(model: str = "fr_core_news_sm") -> Language:
+    """
+    Loads a spaCy pipeline once per process so every syntax detector shares it.
+    Args:
+        model (str): spaCy model to load (downloaded on first use if missing).
+    Returns:
+        Language: The loaded pipeline.
+    """
+    if not spacy.util.is_package(model):
+        spacy.cli.download(model)
+    return spacy.load(model)
+
+
+@lru_cache(maxsize=1024)
+def parse(sentence: str, model: str = "fr_core_news_sm") -> Doc:
+    """
+    Parses a sentence once and shares the resulting Doc across detectors
+    (get_error and correct of every syntax detector hit the same entry).
+    Callers must treat the returned Doc as read-only.
+    Args:
+        sentence (str): The sentence to parse.
+        model (str): spaCy model to use for parsing.
+    Returns:
+        Doc: The parsed sentence.
+    """
+    return load_model(model)(sentence)
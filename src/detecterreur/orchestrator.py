@@ -187,33 +187,37 @@ class Orchestrator:
             List[Tuple[str, str, bool, str]]: (cat, name, has_err, suggested_text)
             If has_err is False, suggested_text is the original input.
         """
+        # 1. Detect on ORIGINAL sentence
+        errors = self.get_error(sentence, category, error_names)
+        return self._suggestions_from_errors(sentence, errors)
+
+    def _suggestions_from_errors(
+        self,
+        sentence: str,
+        errors: List[Tuple[str, str, bool]]
+    ) -> List[Tuple[str, str, bool, str]]:
+        """
+        Builds independent suggestions from detection results already computed
+        on the ORIGINAL sentence, so detection never runs twice per report.
+        """
         results = []
-        
-        # We iterate through detectors in the defined reporting order
-        for detector in self.all_detectors:
-            # Apply Filters
-            if category and detector.error_category not in category:
-                continue
-            if error_names and detector.error_name not in error_names:
+
+        for cat, name, has_err in errors:
+            if not has_err:
+                # No error -> Suggestion is the input itself
+                results.append((cat, name, has_err, sentence))
                 continue
 
+            detector = self.detectors_map[name]
             try:
-                # 1. Detect on ORIGINAL sentence
-                cat, name, has_err = detector.get_error(sentence)
-                
-                if has_err:
-                    # 2. Independent Correction
-                    # We apply this detector's fix to the ORIGINAL sentence.
-                    # This isolates the change (e.g., FAGL only fixes "dansle", ignoring other errors).
-                    suggestion = detector.correct(sentence)
-                    results.append((cat, name, has_err, suggestion))
-                else:
-                    # No error -> Suggestion is the input itself
-                    results.append((cat, name, has_err, sentence))
-
+                # 2. Independent Correction
+                # We apply this detector's fix to the ORIGINAL sentence.
+                # This isolates the change (e.g., FAGL only fixes "dansle", ignoring other errors).
+                suggestion = detector.correct(sentence)
+                results.append((cat, name, has_err, suggestion))
             except Exception as e:
-                print(f"Suggestion generation failed for {detector.error_name}: {e}")
-                results.append((detector.error_category, detector.error_name, False, sentence))
+                print(f"Suggestion generation failed for {name}: {e}")
+                results.append((cat, name, False, sentence))
 
         return results
 
@@ -237,8 +241,8 @@ class Orchestrator:
         # Cascaded Correction (Best Final Result)
         corrected_cascaded = self.correct(sentence, category, error_names)
         
-        # Independent Suggestions (For UI/Debugging)
-        suggestions = self.get_suggestions(sentence, category, error_names)
+        # Independent Suggestions (For UI/Debugging), reusing the detection pass above
+        suggestions = self._suggestions_from_errors(sentence, errors)
 
         return {
             "original": sentence,
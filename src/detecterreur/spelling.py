@@ -0,0 +1,54 @@
+from functools import lru_cache
+from typing import Iterable, Set
+from spellchecker import SpellChecker
+
+
+def get_spellchecker(language: str = "fr", distance: int = 2) -> SpellChecker:
+    """
+    Returns a SpellChecker shared by every detector using the same settings.
+    Loading a dictionary is the heaviest part of building a detector, so it is
+    done once per (language, distance) instead of once per detector.
+    Callers must not modify the returned instance.
+    Args:
+        language (str): Dictionary language.
+        distance (int): Maximum edit distance used by candidates().
+    Returns:
+        SpellChecker: The shared instance.
+    """
+    # Positional call so that defaults and explicit values share a cache entry
+    return _load_spellchecker(language, distance)
+
+
+@lru_cache(maxsize=None)
+def _load_spellchecker(language: str, distance: int) -> SpellChecker:
+    return SpellChecker(language=language, distance=distance)
+
+
+def deletions(words: Iterable[str]) -> Set[str]:
+    """
+    All strings obtained by deleting exactly one character from one of the words.
+    Callers iterating this to reach two or more edits must gate the escalation
+    the way SpellChecker.candidates() does: only go past one edit when the word
+    has no known neighbour at distance 1 (spell.known(spell.edit_distance_1(word))
+    is empty), otherwise ordinary typos get rewritten into unrelated words.
+    Args:
+        words (Iterable[str]): Words to edit.
+    Returns:
+        Set[str]: The one-deletion variants.
+    """
+    return {w[:i] + w[i + 1:] for w in words for i in range(len(w))}
+
+
+def insertions(words: Iterable[str], letters: Iterable[str]) -> Set[str]:
+    """
+    All strings obtained by inserting exactly one of the letters into one of the words.
+    Same contract as deletions(): escalate past one edit only when the word has
+    no known neighbour at distance 1. Each extra tier multiplies the output by
+    roughly len(letters) * len(word), so the gate also bounds the cost.
+    Args:
+        words (Iterable[str]): Words to edit.
+        letters (Iterable[str]): Alphabet to insert from (usually the dictionary's letters).
+    Returns:
+        Set[str]: The one-insertion variants.
+    """
+    return {w[:i] + c + w[i:] for w in words for i in range(len(w) + 1) for c in letters}
@@ -1,5 +1,5 @@
-import spacy
 from typing import Tuple, Set
+from detecterreur.nlp import load_model, parse
 
 class SyntaxInsertion:
     """
@@ -18,9 +18,8 @@ class SyntaxInsertion:
         Args:
             model (str): spaCy model to use for parsing.
         """
-        if not spacy.util.is_package(model):
-            spacy.cli.download(model)
-        self.nlp = spacy.load(model)
+        self.model = model
+        self.nlp = load_model(model)
 
         # Words that are structurally determiners but can legally coexist
         self.allowed_predeterminers = {"tout", "tous", "toute", "toutes"}
@@ -59,7 +58,7 @@ class SyntaxInsertion:
         Returns:
             Tuple[str, str, bool]: (error_category, error_name, has_error)
         """
-        doc = self.nlp(sentence)
+        doc = parse(sentence, self.model)
 
         for token in doc:
             # Check 1: Nouns with multiple determiners
@@ -87,7 +86,7 @@ class SyntaxInsertion:
         Returns:
             str: The corrected sentence.
         """
-        doc = self.nlp(sentence)
+        doc = parse(sentence, self.model)
         tokens_to_remove: Set[int] = set()
 
         for token in doc:
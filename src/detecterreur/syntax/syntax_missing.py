@@ -1,5 +1,6 @@
 import spacy
 from typing import Tuple, List, Dict
+from detecterreur.nlp import load_model, parse
 
 class SyntaxMissing:
     """
@@ -19,9 +20,8 @@ class SyntaxMissing:
         Args:
             model (str): spaCy model to use for parsing.
         """
-        if not spacy.util.is_package(model):
-            spacy.cli.download(model)
-        self.nlp = spacy.load(model)
+        self.model = model
+        self.nlp = load_model(model)
 
         # Indicators for imperative mood
         self.imperative_indicators = {"!", "."}
@@ -41,7 +41,7 @@ class SyntaxMissing:
         Returns:
             Tuple[str, str, bool]: (error_category, error_name, has_error)
         """
-        doc = self.nlp(sentence)
+        doc = parse(sentence, self.model)
 
         # Check 1: Sentence fragments (no finite verb)
         if len(doc) > 2 and self._is_sentence_fragment(doc):
@@ -77,7 +77,7 @@ class SyntaxMissing:
         Returns:
             str: The corrected sentence.
         """
-        doc = self.nlp(sentence)
+        doc = parse(sentence, self.model)
         insertions: List[Tuple[int, str]] = []
 
         for token in doc:
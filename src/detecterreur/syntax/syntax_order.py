@@ -1,5 +1,6 @@
 import spacy
 from typing import Tuple, List, Set, Optional
+from detecterreur.nlp import load_model, parse
 
 class SyntaxOrder:
     """
@@ -21,9 +22,8 @@ class SyntaxOrder:
         Args:
             model (str): spaCy model to use for parsing.
         """
-        if not spacy.util.is_package(model):
-            spacy.cli.download(model)
-        self.nlp = spacy.load(model)
+        self.model = model
+        self.nlp = load_model(model)
 
         # BAGS Adjectives (must come before noun)
         self.pre_noun_adjectives: Set[str] = {
@@ -52,7 +52,7 @@ class SyntaxOrder:
         Returns:
             Tuple[str, str, bool]: (error_category, error_name, has_error)
         """
-        doc = self.nlp(sentence)
+        doc = parse(sentence, self.model)
 
         checks = [
             self._check_determiner_noun_order(doc),
@@ -74,7 +74,7 @@ class SyntaxOrder:
         Returns:
             str: The corrected sentence or a suggestion.
         """
-        doc = self.nlp(sentence)
+        doc = parse(sentence, self.model)
 
         if self._check_determiner_noun_order(doc)[0]:
             return self._fix_determiner_noun_order(doc)
@@ -1,5 +1,6 @@
 import spacy
 from typing import Tuple, List
+from detecterreur.nlp import load_model, parse
 
 class SyntaxRedundancy:
     """
@@ -17,9 +18,8 @@ class SyntaxRedundancy:
         Args:
             model (str): spaCy model to use for parsing.
         """
-        if not spacy.util.is_package(model):
-            spacy.cli.download(model)
-        self.nlp = spacy.load(model)
+        self.model = model
+        self.nlp = load_model(model)
 
         # Reflexive pronouns that can validly double (e.g., "nous nous")
         self.reflexive_pronouns: set = {"me", "te", "se", "nous", "vous"}
@@ -63,7 +63,7 @@ class SyntaxRedundancy:
         Returns:
             Tuple[str, str, bool]: (error_category, error_name, has_error)
         """
-        doc = self.nlp(sentence)
+        doc = parse(sentence, self.model)
 
         for i in range(len(doc) - 1):
             token = doc[i]
@@ -93,7 +93,7 @@ class SyntaxRedundancy:
         Returns:
             str: The corrected sentence.
         """
-        doc = self.nlp(sentence)
+        doc = parse(sentence, self.model)
         tokens_to_keep: List[str] = []
         i = 0
 
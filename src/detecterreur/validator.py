@@ -1,5 +1,6 @@
 import spacy
-from spellchecker import SpellChecker
+from functools import lru_cache
+from detecterreur.spelling import get_spellchecker
 
 class Validator:
     _instance = None
@@ -13,14 +14,16 @@ class Validator:
                 # 1. Chargement de spaCy (léger)
                 cls._nlp = spacy.load("fr_core_news_sm", disable=["parser", "ner", "lemmatizer", "textcat"])
                 # 2. Chargement de pyspellchecker (fr)
-                cls._spell = SpellChecker(language='fr')
+                cls._spell = get_spellchecker('fr')
             except OSError:
                 raise ImportError("Please run: python -m spacy download fr_core_news_sm")
         return cls._instance
 
+    @lru_cache(maxsize=65536)
     def is_valid(self, word: str) -> bool:
         """
         Vérifie si un mot est valide en utilisant spaCy ET pyspellchecker.
+        Le résultat est mis en cache (le Validator est un singleton).
         """
         word_clean = word.strip().lower()
 
@@ -1,4 +1,5 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Union, Dict, Any
 from detecterreur.orchestrator import Orchestrator
@@ -9,7 +10,11 @@ def run_test(source: Union[List[str], str]):
     1. A list of strings (sentences)
     2. A string (file path)
     """
-    orc = Orchestrator()
+    # Build the detectors (spaCy, dictionaries) in the background while the
+    # sentences are being loaded
+    executor = ThreadPoolExecutor(max_workers=1)
+    orc_future = executor.submit(Orchestrator)
+    executor.shutdown(wait=False)
 
     # 1. Load Sentences
     sentences = []
@@ -29,23 +34,25 @@ def run_test(source: Union[List[str], str]):
             print(f"Failed to read file: {e}")
             return
 
+    orc = orc_future.result()
+
     # 2. Process
     for i, s in enumerate(sentences, 1):
         print(f"--- Test #{i} -----------------------------------------------------------")
         print(f"Original:   {s}")
 
+        # Single pass: the report carries detection, correction and suggestions
+        report = orc.get_detailed_report(s)
+
         # A. Get Errors (Detection Phase)
-        errors = orc.get_error(s)
-        detected_errors = [f"[{cat}] {name}" for cat, name, is_err in errors if is_err]
+        detected_errors = [f"[{cat}] {name}" for cat, name, is_err in report["errors"] if is_err]
 
         print(f"Detected:   {', '.join(detected_errors) if detected_errors else 'None'}")
 
         # B. Correct (Correction Phase)
-        correction = orc.correct(s)
-        print(f"Correction: {correction}")
+        print(f"Correction: {report['corrected']}")
 
         # C. Get Detailed Report
-        report = orc.get_detailed_report(s)
         print(f"Summary:    {report['summary']['total_errors']} errors found")
         print(f"Suggestions:\n{report['suggestions']}")
         print("")